@@ -1,16 +1,25 @@
 #!/usr/bin/env python3
 import http.server
+import io
+import mimetypes
 import os
 import posixpath
-import re
+import signal
+import stat
 import sys
+import threading
+import time
 import urllib.parse
-from functools import lru_cache
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
 WORKSPACE_DIR = os.path.abspath(os.path.dirname(__file__))
 BLOG_ROOT = os.path.join(WORKSPACE_DIR, "blog")
 
+LANG_CODES = ("us", "mexico", "latam")
+_LANG_SET = frozenset(LANG_CODES)
+
 
 class SlugMeta:
 	def __init__(self, slug: str, abs_index_path: str, language: Optional[str], category: Optional[str]):
@@ -18,48 +27,74 @@ class SlugMeta:
 		self.abs_index_path = abs_index_path
 		self.language = language
 		self.category = category
+		# If language/category known, use nested form; otherwise fallback to flat
+		if language and category:
+			self.canonical_url = f"/blog/{language}/{category}/{slug}"
+		else:
+			self.canonical_url = f"/blog/{slug}"
 
 
-def build_slug_meta_map() -> Dict[str, 'SlugMeta']:
+def build_slug_meta_map() -> Tuple[Dict[str, 'SlugMeta'], Dict[str, str]]:
 	"""Scan the blog tree for index.html files and map slug -> metadata.
 
 	Expected preferred structure: blog/<language>/<category>/<slug>/index.html
 	Falls back gracefully if structure differs.
+
+	Also returns category -> language for every blog/<language>/<category>/index.html,
+	preferring languages in LANG_CODES order when a category exists in several.
 	"""
 	slug_to_meta: Dict[str, SlugMeta] = {}
-	for current_dir, _subdirs, files in os.walk(BLOG_ROOT):
-		if "index.html" not in files:
-			continue
-		abs_index_path = os.path.join(current_dir, "index.html")
-		rel_dir = os.path.relpath(current_dir, BLOG_ROOT)
-		parts = [p for p in rel_dir.split(os.sep) if p]
-		slug = parts[-1] if parts else os.path.basename(current_dir.rstrip(os.sep))
-		language = parts[0] if len(parts) >= 3 else None
-		category = parts[1] if len(parts) >= 3 else None
-		if slug not in slug_to_meta:
-			slug_to_meta[slug] = SlugMeta(slug, abs_index_path, language, category)
-		else:
-			print(f"[warn] Duplicate slug '{slug}' -> {abs_index_path} (already mapped to {slug_to_meta[slug].abs_index_path})")
-	return slug_to_meta
-
+	category_to_lang: Dict[str, str] = {}
 
-SLUG_META = build_slug_meta_map()
+	# Depth-first scandir walk: DirEntry carries the file type from the directory listing,
+	# so classifying entries needs no extra stat call
+	def walk(current_dir: str, parts: List[str]) -> None:
+		abs_index_path = None
+		subdirs = []
+		try:
+			with os.scandir(current_dir) as it:
+				for entry in it:
+					if entry.is_dir(follow_symlinks=False):
+						subdirs.append(entry)
+					elif entry.name == "index.html" and entry.is_file():
+						abs_index_path = entry.path
+		except OSError:
+			return
+		if abs_index_path is not None:
+			# The blog root itself keys as os.curdir, the name os.path.relpath gives it
+			slug = parts[-1] if parts else os.curdir
+			language = parts[0] if len(parts) >= 3 else None
+			category = parts[1] if len(parts) >= 3 else None
+			if slug not in slug_to_meta:
+				slug_to_meta[slug] = SlugMeta(slug, abs_index_path, language, category)
+			else:
+				print(f"[warn] Duplicate slug '{slug}' -> {abs_index_path} (already mapped to {slug_to_meta[slug].abs_index_path})")
+			if len(parts) == 2 and parts[0] in _LANG_SET:
+				known = category_to_lang.get(parts[1])
+				if known is None or LANG_CODES.index(parts[0]) < LANG_CODES.index(known):
+					category_to_lang[parts[1]] = parts[0]
+		for entry in subdirs:
+			walk(entry.path, parts + [entry.name])
+
+	walk(BLOG_ROOT, [])
+	return slug_to_meta, category_to_lang
+
+
+SLUG_META, CATEGORY_TO_LANG = build_slug_meta_map()
 print(f"[info] Loaded {len(SLUG_META)} blog slugs")
 
 
-SECTION_PREFIXES = (
-	"us",
-	"mexico",
-	"latam",
-	"uncategorized",
-	"tag",
-	"author",
-	"page",
-	"our-founder",
-	"press",
-)
+def reload_slug_meta() -> None:
+	"""Rescan the blog tree after content changes (wired to SIGHUP in run())."""
+	global SLUG_META, CATEGORY_TO_LANG
+	SLUG_META, CATEGORY_TO_LANG = build_slug_meta_map()
+	with _stat_cache_lock:
+		_stat_cache.clear()
+	_clear_response_cache()
+	# After the swap above, so any decision resolved against the old maps sees a new generation
+	_clear_route_cache()
+	print(f"[info] Reloaded {len(SLUG_META)} blog slugs")
 
-LANG_CODES = ("us", "mexico", "latam")
 
 ASSET_PREFIXES = (
 	"wp-content",
@@ -71,20 +106,141 @@ ASSET_PREFIXES = (
 
 STATIC_PAGES = ("faq", "about", "press")
 
+# "/<prefix>" and "/<prefix>/" forms of ASSET_PREFIXES, built once for the asset check in do_GET
+_ASSET_PREFIX_EXACT = frozenset(f"/{prefix}" for prefix in ASSET_PREFIXES)
+_ASSET_PREFIX_SLASH = tuple(f"/{prefix}/" for prefix in ASSET_PREFIXES)
+
+# Trailing segments accepted after /<lang> and /<lang>/<category>: "", "/", "/index.html", "/index.html/"
+_INDEX_TAILS = ([], [""], ["index.html"], ["index.html", ""])
+
+# Routing probes the same few index.html paths on every request; remember each stat result briefly.
+# Only paths that exist and are at most STAT_CACHE_MAX_PATH long are kept: misses come from
+# open-ended client URLs (asset probes in particular) and would only crowd out the real entries.
+STAT_CACHE_TTL = 10.0
+STAT_CACHE_MAX_ENTRIES = 4096
+STAT_CACHE_MAX_PATH = 1024
+_stat_cache: Dict[str, Tuple[float, int]] = {}
+_stat_cache_lock = threading.Lock()
+
+
+def _cached_mode(path: str) -> int:
+	"""Return st_mode for path (0 if it cannot be stat'ed); hits are cached for STAT_CACHE_TTL seconds."""
+	now = time.monotonic()
+	entry = _stat_cache.get(path)
+	if entry is not None and now - entry[0] < STAT_CACHE_TTL:
+		return entry[1]
+	try:
+		mode = os.stat(path).st_mode
+	except (OSError, ValueError):
+		return 0
+	if len(path) > STAT_CACHE_MAX_PATH:
+		return mode
+	with _stat_cache_lock:
+		if len(_stat_cache) >= STAT_CACHE_MAX_ENTRIES:
+			_stat_cache.clear()
+		_stat_cache[path] = (now, mode)
+	return mode
+
+
+def _isfile(path: str) -> bool:
+	return stat.S_ISREG(_cached_mode(path))
+
+
+def _isdir(path: str) -> bool:
+	return stat.S_ISDIR(_cached_mode(path))
+
+
+# Served files up to RESPONSE_CACHE_MAX_FILE are kept in memory, least recently used first out
+# once the total passes RESPONSE_CACHE_MAX_BYTES. Entries are checked against a fresh stat on
+# every hit; larger files are always sent with sendfile.
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+RESPONSE_CACHE_MAX_FILE = 256 * 1024
+_response_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], bytes]]" = OrderedDict()
+_response_cache_bytes = 0
+_response_cache_lock = threading.Lock()
+
+
+def _file_signature(fs: os.stat_result) -> Tuple[int, int, int]:
+	return (fs.st_ino, fs.st_size, fs.st_mtime_ns)
+
+
+def _cached_body(path: str, fs: os.stat_result) -> Optional[bytes]:
+	with _response_cache_lock:
+		entry = _response_cache.get(path)
+		if entry is None or entry[0] != _file_signature(fs):
+			return None
+		_response_cache.move_to_end(path)
+		return entry[1]
+
+
+def _store_body(path: str, fs: os.stat_result, body: bytes) -> None:
+	global _response_cache_bytes
+	with _response_cache_lock:
+		previous = _response_cache.pop(path, None)
+		if previous is not None:
+			_response_cache_bytes -= len(previous[1])
+		_response_cache[path] = (_file_signature(fs), body)
+		_response_cache_bytes += len(body)
+		while _response_cache_bytes > RESPONSE_CACHE_MAX_BYTES:
+			_evicted_path, (_signature, evicted) = _response_cache.popitem(last=False)
+			_response_cache_bytes -= len(evicted)
+
+
+def _clear_response_cache() -> None:
+	global _response_cache_bytes
+	with _response_cache_lock:
+		_response_cache.clear()
+		_response_cache_bytes = 0
+
+
+# File extension -> Content-Type, filled by BlogRequestHandler.guess_type
+_MIME_CACHE: Dict[str, str] = {}
+
+
+def _is_page_number(value: str) -> bool:
+	return value.isascii() and value.isdigit()
+
 
 class BlogRequestHandler(http.server.SimpleHTTPRequestHandler):
+	# Keep connections open between requests (every response carries a Content-Length);
+	# idle clients are dropped after `timeout` seconds so they do not pin a thread
+	protocol_version = "HTTP/1.1"
+	timeout = 30
+	# Buffer wfile so the header block (already joined by end_headers) and any small body written
+	# after it leave in a single send when handle_one_request flushes
+	wbufsize = 64 * 1024
+
 	def translate_path(self, path: str) -> str:
-		path = posixpath.normpath(urllib.parse.unquote(path))
+		path = urllib.parse.unquote(path)
+		# Fast path: an absolute path without empty, dot or backslash segments is already what
+		# normpath and the word filter below would produce, so join it directly
+		if path.startswith("/") and "//" not in path and "/." not in path and "\\" not in path:
+			relative = path.strip("/")
+			return os.path.join(WORKSPACE_DIR, relative) if relative else WORKSPACE_DIR
+		path = posixpath.normpath(path)
 		words = path.lstrip('/').split('/') if path else []
 		resolved = WORKSPACE_DIR
 		for word in words:
-			if not word:
+			if not word or word in (os.curdir, os.pardir):
 				continue
 			if os.path.dirname(word) or os.path.basename(word) != word:
 				continue
 			resolved = os.path.join(resolved, word)
 		return resolved
 
+	def guess_type(self, path: str) -> str:
+		# Served files use a handful of extensions; remember the answer per extension. Only
+		# extensions the type tables know are kept (send_head asks before opening the file, so
+		# unknown suffixes of missing files reach here too), and compression suffixes (.gz, .br,
+		# ...) are skipped since the type then depends on the inner extension.
+		ext = posixpath.splitext(path)[1].lower()
+		content_type = _MIME_CACHE.get(ext)
+		if content_type is None:
+			content_type = super().guess_type(path)
+			if (ext in self.extensions_map or ext in mimetypes.types_map) and ext not in mimetypes.encodings_map:
+				_MIME_CACHE[ext] = content_type
+		return content_type
+
 	def log_message(self, format: str, *args) -> None:
 		sys.stderr.write("%s - - [%s] %s\n" % (self.address_string(), self.log_date_time_string(), format % args))
 
@@ -96,263 +252,365 @@ class BlogRequestHandler(http.server.SimpleHTTPRequestHandler):
 			self._is_head = False
 
 	def do_GET(self) -> None:
-		parsed = urllib.parse.urlparse(self.path)
-		clean_path = parsed.path
-
-		# 0) Map root asset requests (e.g., /wp-content/*) to blog assets
-		for prefix in ASSET_PREFIXES:
-			if clean_path == f"/{prefix}" or clean_path.startswith(f"/{prefix}/"):
-				mapped = os.path.join(BLOG_ROOT, clean_path.lstrip('/'))
-				if os.path.isdir(mapped):
-					candidate = os.path.join(mapped, "index.html")
-					if os.path.isfile(candidate):
-						return self._serve_absolute(candidate)
-				if os.path.isfile(mapped):
-					return self._serve_absolute(mapped)
-				break
-
-		# Redirect mirrored host root to /blog (e.g., /blog2.roomiapp.com[/index.html])
-		if clean_path == "/blog2.roomiapp.com" or clean_path == "/blog2.roomiapp.com/" or clean_path == "/blog2.roomiapp.com/index.html":
-			return self._redirect_permanent("/blog")
-
-		# Root-level numeric paths should behave like /blog/<n>
-		m_root_num_idx = re.fullmatch(r"/([0-9]+)/index\.html", clean_path)
-		if m_root_num_idx:
-			page = m_root_num_idx.group(1)
-			return self._redirect_permanent("/blog" if page == "1" else f"/blog/{page}")
-		m_root_num_dir = re.fullmatch(r"/([0-9]+)/?", clean_path)
-		if m_root_num_dir:
-			page = m_root_num_dir.group(1)
-			return self._redirect_permanent("/blog" if page == "1" else f"/blog/{page}")
-
-		# 0b) Static pages: /faq, /about, /press -> serve blog/<page>/index.html
-		for page in STATIC_PAGES:
-			if clean_path == f"/{page}":
-				candidate = os.path.join(BLOG_ROOT, page, "index.html")
-				if os.path.isfile(candidate):
-					return self._serve_absolute(candidate)
-				return self._send_404()
-			if clean_path == f"/{page}/index.html" or clean_path == f"/{page}/":
-				return self._redirect_permanent(f"/{page}")
-
-		# Enforce no trailing slash for main blog page
-		if clean_path == "/blog/":
-			return self._redirect_permanent("/blog")
-
-		# Redirect /blog/index.html (used by Categories button) to /blog/us
-		if clean_path == "/blog/index.html":
-			return self._redirect_permanent("/blog/us")
-
-		# 1) Main blog page: /blog -> serve blog/index.html
-		if clean_path == "/blog":
-			return self._serve_absolute(os.path.join(BLOG_ROOT, "index.html"))
-
-		# 1a) Language listing: /blog/<lang>
-		m_lang = re.fullmatch(r"/blog/(us|mexico|latam)", clean_path)
-		if m_lang:
-			lang = m_lang.group(1)
-			candidate = os.path.join(BLOG_ROOT, lang, "index.html")
-			if os.path.isfile(candidate):
-				return self._serve_absolute(candidate)
-			return self._send_404()
-
-		# 1a.x) If path is /blog/<lang>/<name> and <name> is actually a post slug, redirect to canonical
-		m_lang_name_idx = re.fullmatch(r"/blog/(us|mexico|latam)/([^/]+)/index\.html", clean_path)
-		if m_lang_name_idx:
-			lang, name = m_lang_name_idx.group(1), m_lang_name_idx.group(2)
-			meta = SLUG_META.get(name)
-			if meta and os.path.isfile(meta.abs_index_path):
-				return self._redirect_permanent(self._canonical_slug_url(meta))
-		m_lang_name_dir = re.fullmatch(r"/blog/(us|mexico|latam)/([^/]+)/", clean_path)
-		if m_lang_name_dir:
-			lang, name = m_lang_name_dir.group(1), m_lang_name_dir.group(2)
-			meta = SLUG_META.get(name)
-			if meta and os.path.isfile(meta.abs_index_path):
-				return self._redirect_permanent(self._canonical_slug_url(meta))
-
-		# 1a.1) Category listing: /blog/<lang>/<category>
-		m_lang_cat = re.fullmatch(r"/blog/(us|mexico|latam)/([^/]+)", clean_path)
-		if m_lang_cat:
-			lang, category = m_lang_cat.group(1), m_lang_cat.group(2)
-			candidate = os.path.join(BLOG_ROOT, lang, category, "index.html")
-			if os.path.isfile(candidate):
-				return self._serve_absolute(candidate)
-			# If not category, let deeper rules handle as post
-
-		# 1a.y) Common WordPress related posts format: /blog/<category>/<slug>[/index.html]
-		m_cat_slug_idx = re.fullmatch(r"/blog/([^/]+)/([^/]+)/index\.html", clean_path)
-		if m_cat_slug_idx:
-			category, slug = m_cat_slug_idx.group(1), m_cat_slug_idx.group(2)
-			meta = SLUG_META.get(slug)
-			if meta and os.path.isfile(meta.abs_index_path):
-				return self._redirect_permanent(self._canonical_slug_url(meta))
-		m_cat_slug_dir = re.fullmatch(r"/blog/([^/]+)/([^/]+)/", clean_path)
-		if m_cat_slug_dir:
-			category, slug = m_cat_slug_dir.group(1), m_cat_slug_dir.group(2)
-			meta = SLUG_META.get(slug)
-			if meta and os.path.isfile(meta.abs_index_path):
-				return self._redirect_permanent(self._canonical_slug_url(meta))
-
-		# 1b) Pagination: /blog/<n> -> serve blog/page/<n>/index.html (n=1 -> /blog)
-		m_page = re.fullmatch(r"/blog/([0-9]+)", clean_path)
-		if m_page:
-			page_num = m_page.group(1)
-			if page_num == "1":
-				return self._redirect_permanent("/blog")
-			abs_index = os.path.join(BLOG_ROOT, "page", page_num, "index.html")
-			if os.path.isfile(abs_index):
-				return self._serve_absolute(abs_index)
-			return self._send_404()
-
-		# 1c) Redirect /blog/page/<n>[/index.html] -> /blog or /blog/<n>
-		m_page_old_idx = re.fullmatch(r"/blog/page/([0-9]+)/index\.html", clean_path)
-		if m_page_old_idx:
-			pg = m_page_old_idx.group(1)
-			return self._redirect_permanent("/blog" if pg == "1" else f"/blog/{pg}")
-		m_page_old_dir = re.fullmatch(r"/blog/page/([0-9]+)/?", clean_path)
-		if m_page_old_dir:
-			pg = m_page_old_dir.group(1)
-			return self._redirect_permanent("/blog" if pg == "1" else f"/blog/{pg}")
-
-		# Legacy: redirect /<lang>[/index.html] -> /blog/<lang>
-		m_legacy_lang = re.fullmatch(r"/(us|mexico|latam)(?:/index\.html)?/?", clean_path)
-		if m_legacy_lang:
-			return self._redirect_permanent(f"/blog/{m_legacy_lang.group(1)}")
-
-		# Legacy: redirect /<lang>/<category>[/index.html] -> /blog/<lang>/<category>
-		m_legacy_lang_cat = re.fullmatch(r"/(us|mexico|latam)/([^/]+)(?:/index\.html)?/?", clean_path)
-		if m_legacy_lang_cat:
-			lang, category = m_legacy_lang_cat.group(1), m_legacy_lang_cat.group(2)
-			candidate = os.path.join(BLOG_ROOT, lang, category, "index.html")
-			if os.path.isfile(candidate):
-				return self._redirect_permanent(f"/blog/{lang}/{category}")
-
-		# Resolve /blog/<category> to the first language that has it (preferring us, then mexico, then latam)
-		m_possible_category = re.fullmatch(r"/blog/([^/]+)", clean_path)
-		if m_possible_category:
-			name = m_possible_category.group(1)
-			for lang in LANG_CODES:
-				candidate = os.path.join(BLOG_ROOT, lang, name, "index.html")
-				if os.path.isfile(candidate):
-					return self._redirect_permanent(f"/blog/{lang}/{name}")
-			# If not a category, we will try as a post slug below
-
-		# 2) Preferred nested blog URL: /blog/<lang>/<category>/<slug>
-		m_nested = re.fullmatch(r"/blog/([^/]+)/([^/]+)/([^/]+)", clean_path)
-		if m_nested:
-			lang, category, slug = m_nested.group(1), m_nested.group(2), m_nested.group(3)
-			meta = SLUG_META.get(slug)
-			if meta and meta.language == lang and meta.category == category and os.path.isfile(meta.abs_index_path):
-				return self._serve_absolute(meta.abs_index_path)
-			if meta and os.path.isfile(meta.abs_index_path):
-				canonical = self._canonical_slug_url(meta)
-				return self._redirect_permanent(canonical)
-			return self._send_404()
-
-		# 2b) Old flat blog URL: /blog/<slug> -> redirect to nested if known
-		m_flat = re.fullmatch(r"/blog/([^/]+)", clean_path)
-		if m_flat:
-			slug = m_flat.group(1)
-			meta = SLUG_META.get(slug)
-			if meta and os.path.isfile(meta.abs_index_path):
-				return self._redirect_permanent(self._canonical_slug_url(meta))
+		# str.partition covers ordinary "/path?query" targets; urlparse is only needed for the
+		# forms it treats specially (fragments, ;params, absolute or scheme-relative URLs)
+		clean_path, _, query = self.path.partition("?")
+		if not clean_path.startswith("/") or clean_path.startswith("//") or ";" in clean_path or "#" in self.path:
+			parsed = urllib.parse.urlparse(self.path)
+			clean_path, query = parsed.path, parsed.query
+		self._query = query
+
+		# Asset lookups stay out of the route cache: upload URLs are open-ended and files under
+		# them can appear at any time, so they are re-checked (through the stat cache) every time
+		decision = _route_asset(clean_path)
+		if decision is None:
+			decision = _route(clean_path)
+
+		kind, target = decision
+		if kind == ROUTE_SERVE:
+			return self._serve_absolute(target)
+		if kind == ROUTE_REDIRECT:
+			return self._redirect_permanent(target)
+		if kind == ROUTE_NOT_FOUND:
 			return self._send_404()
+		return self._serve_static()
 
-		# 3) Redirect /blog/(.../)?<slug>/index.html -> nested
-		m_deep_idx = re.fullmatch(r"/blog/(?:.*/)?([^/]+)/index\.html", clean_path)
-		if m_deep_idx:
-			slug = m_deep_idx.group(1)
-			meta = SLUG_META.get(slug)
-			if meta:
-				return self._redirect_permanent(self._canonical_slug_url(meta))
-
-		# 4) Redirect /blog/(.../)?<slug>/ -> nested when the slug exists
-		m_deep_dir = re.fullmatch(r"/blog/(?:.*/)?([^/]+)/", clean_path)
-		if m_deep_dir:
-			slug = m_deep_dir.group(1)
-			meta = SLUG_META.get(slug)
-			if meta and os.path.isfile(meta.abs_index_path):
-				return self._redirect_permanent(self._canonical_slug_url(meta))
-
-		# 5) Non-/blog deep paths like /section/.../slug/index.html -> redirect to nested
-		m_non_blog_idx = re.fullmatch(r"/(?:" + "|".join(map(re.escape, SECTION_PREFIXES)) + r")/.*/([^/]+)/index\.html", clean_path)
-		if m_non_blog_idx:
-			slug = m_non_blog_idx.group(1)
-			meta = SLUG_META.get(slug)
-			if meta:
-				return self._redirect_permanent(self._canonical_slug_url(meta))
-
-		# 6) Non-/blog deep paths ending with / -> redirect if slug exists
-		m_non_blog_dir = re.fullmatch(r"/(?:" + "|".join(map(re.escape, SECTION_PREFIXES)) + r")/.*/([^/]+)/", clean_path)
-		if m_non_blog_dir:
-			slug = m_non_blog_dir.group(1)
-			meta = SLUG_META.get(slug)
-			if meta and os.path.isfile(meta.abs_index_path):
-				return self._redirect_permanent(self._canonical_slug_url(meta))
-
-		# 7) Generic catch-all for any deep path ending in /index.html (outside /blog)
-		if clean_path.startswith("/blog/") is False:
-			m_any_idx = re.fullmatch(r"/.*/([^/]+)/index\.html", clean_path)
-			if m_any_idx:
-				slug = m_any_idx.group(1)
-				meta = SLUG_META.get(slug)
-				if meta:
-					return self._redirect_permanent(self._canonical_slug_url(meta))
-			m_any_dir = re.fullmatch(r"/.*/([^/]+)/", clean_path)
-			if m_any_dir:
-				slug = m_any_dir.group(1)
-				meta = SLUG_META.get(slug)
-				if meta and os.path.isfile(meta.abs_index_path):
-					return self._redirect_permanent(self._canonical_slug_url(meta))
-
-		# 8) Favicon fallthrough: try blog/favicon.ico if root missing
-		if clean_path == "/favicon.ico":
-			fav = os.path.join(BLOG_ROOT, "favicon.ico")
-			if os.path.isfile(fav):
-				return self._serve_absolute(fav)
-
-		# 9) Anything else: fall back to default static file handling
-		return super().do_GET()
-
-	def _canonical_slug_url(self, meta: SlugMeta) -> str:
-		# If language/category known, use nested form; otherwise fallback to flat
-		if meta.language and meta.category:
-			return f"/blog/{meta.language}/{meta.category}/{meta.slug}"
-		return f"/blog/{meta.slug}"
+	def _serve_static(self) -> None:
+		# Default SimpleHTTPRequestHandler file/directory handling; HEAD must not send the body
+		if getattr(self, "_is_head", False):
+			super().do_HEAD()
+		else:
+			super().do_GET()
 
 	def _serve_absolute(self, absolute_path: str) -> None:
-		if not os.path.isfile(absolute_path):
+		try:
+			fs = os.stat(absolute_path)
+		except (OSError, ValueError):
 			return self._send_404()
+		if not stat.S_ISREG(fs.st_mode):
+			return self._send_404()
+		body = _cached_body(absolute_path, fs)
 		try:
 			content_type = self.guess_type(absolute_path)
-			fs = os.stat(absolute_path)
 			self.send_response(200)
 			self.send_header("Content-type", content_type)
 			self.send_header("Content-Length", str(fs.st_size))
 			self.end_headers()
+			# wfile is buffered: flush here rather than in handle_one_request so a client that
+			# already went away is caught below instead of escaping the handler
 			if getattr(self, "_is_head", False):
+				self.wfile.flush()
+				return
+			if body is not None:
+				self.wfile.write(body)
+				self.wfile.flush()
 				return
 			with open(absolute_path, "rb") as f:
-				self.copyfile(f, self.wfile)
-		except BrokenPipeError:
-			pass
+				if fs.st_size <= RESPONSE_CACHE_MAX_FILE:
+					# Small bodies join the buffered header block and are remembered for next time
+					body = f.read(fs.st_size)
+					self.wfile.write(body)
+					self.wfile.flush()
+					if len(body) == fs.st_size:
+						_store_body(absolute_path, fs, body)
+					else:
+						# Truncated after the stat: the body falls short of Content-Length
+						self.close_connection = True
+					return
+				# socket.sendfile uses sendfile(2) where available (and plain send otherwise), so the
+				# body goes from the page cache to the socket without a copy through Python buffers
+				self.wfile.flush()
+				if self.request.sendfile(f, 0, fs.st_size) != fs.st_size:
+					# The file shrank after the stat; the advertised length can no longer be met
+					self.close_connection = True
+		except (BrokenPipeError, ConnectionResetError):
+			self.close_connection = True
+			# A failed flush leaves the bytes in the BufferedWriter, and handle_one_request and
+			# finish would retry (and raise) on them; the client is gone, so drop the writer
+			stale, self.wfile = self.wfile, io.BytesIO()
+			try:
+				stale.close()
+			except OSError:
+				pass
 
 	def _redirect_permanent(self, location_path: str) -> None:
-		parsed = urllib.parse.urlparse(self.path)
-		qs = f"?{parsed.query}" if parsed.query else ""
-		location = location_path + qs
-		self.send_response(301)
-		self.send_header("Location", location)
-		self.end_headers()
+		# Carry the query string do_GET already parsed; the whole bodyless response is one write
+		location = f"{location_path}?{self._query}" if self._query else location_path
+		self.log_request(301)
+		if self.request_version == "HTTP/0.9":
+			return
+		self.wfile.write((
+			f"{self.protocol_version} 301 Moved Permanently\r\n"
+			f"Server: {self.version_string()}\r\n"
+			f"Date: {self.date_time_string()}\r\n"
+			f"Location: {location}\r\n"
+			"Content-Length: 0\r\n\r\n"
+		).encode("latin-1", "strict"))
 
 	def _send_404(self) -> None:
 		self.send_error(404, "File not found")
 
 
+# What do_GET should send for a path: serve a file, redirect (query string appended by
+# _redirect_permanent), 404, or fall back to SimpleHTTPRequestHandler
+ROUTE_SERVE = "serve"
+ROUTE_REDIRECT = "redirect"
+ROUTE_NOT_FOUND = "404"
+ROUTE_FALLBACK = "fallback"
+
+
+class RouteDecision(NamedTuple):
+	kind: str
+	target: str = ""
+
+
+_NOT_FOUND = RouteDecision(ROUTE_NOT_FOUND)
+_FALLBACK = RouteDecision(ROUTE_FALLBACK)
+
+
+def _serve(path: str) -> RouteDecision:
+	return RouteDecision(ROUTE_SERVE, path)
+
+
+def _redirect(location: str) -> RouteDecision:
+	return RouteDecision(ROUTE_REDIRECT, location)
+
+
+def _route_asset(clean_path: str) -> Optional[RouteDecision]:
+	# 0) Map root asset requests (e.g., /wp-content/*) to blog assets
+	if clean_path in _ASSET_PREFIX_EXACT or clean_path.startswith(_ASSET_PREFIX_SLASH):
+		mapped = os.path.join(BLOG_ROOT, clean_path.lstrip('/'))
+		if _isdir(mapped):
+			candidate = os.path.join(mapped, "index.html")
+			if _isfile(candidate):
+				return _serve(candidate)
+		if _isfile(mapped):
+			return _serve(mapped)
+	return None
+
+
+# Routes for _EXACT_ROUTES. Each returns a decision, or None to let _route try later rules.
+
+def _route_blog_home() -> Optional[RouteDecision]:
+	# 1) Main blog page: /blog -> serve blog/index.html
+	return _serve(os.path.join(BLOG_ROOT, "index.html"))
+
+
+def _route_static_page(page: str) -> Optional[RouteDecision]:
+	# 0b) Static pages: /faq, /about, /press -> serve blog/<page>/index.html
+	candidate = os.path.join(BLOG_ROOT, page, "index.html")
+	return _serve(candidate) if _isfile(candidate) else _NOT_FOUND
+
+
+def _route_favicon() -> Optional[RouteDecision]:
+	# 8) Favicon fallthrough: try blog/favicon.ico, otherwise leave it to static file handling
+	fav = os.path.join(BLOG_ROOT, "favicon.ico")
+	return _serve(fav) if _isfile(fav) else None
+
+
+# Routes for _DISPATCH. Each receives the path split on "/" (without the leading empty
+# segment) and returns a decision, or None to let _route try later rules.
+
+def _route_root_page(segments: List[str]) -> Optional[RouteDecision]:
+	# Root-level numeric paths (/<n>, /<n>/, /<n>/index.html) should behave like /blog/<n>
+	if len(segments) == 2 and segments[1] not in ("", "index.html"):
+		return None
+	page = segments[0]
+	return _redirect("/blog" if page == "1" else f"/blog/{page}")
+
+
+def _route_legacy_lang(segments: List[str]) -> Optional[RouteDecision]:
+	lang = segments[0]
+	# Legacy: redirect /<lang>[/index.html] -> /blog/<lang>
+	if segments[1:] in _INDEX_TAILS:
+		return _redirect(f"/blog/{lang}")
+	# Legacy: redirect /<lang>/<category>[/index.html] -> /blog/<lang>/<category>
+	category = segments[1]
+	if category and segments[2:] in _INDEX_TAILS:
+		candidate = os.path.join(BLOG_ROOT, lang, category, "index.html")
+		if _isfile(candidate):
+			return _redirect(f"/blog/{lang}/{category}")
+	return None
+
+
+def _route_blog_name(segments: List[str]) -> Optional[RouteDecision]:
+	name = segments[1]
+	if not name:
+		return None
+
+	# 1a) Language listing: /blog/<lang>
+	if name in _LANG_SET:
+		candidate = os.path.join(BLOG_ROOT, name, "index.html")
+		return _serve(candidate) if _isfile(candidate) else _NOT_FOUND
+
+	# 1b) Pagination: /blog/<n> -> serve blog/page/<n>/index.html (n=1 -> /blog)
+	if _is_page_number(name):
+		if name == "1":
+			return _redirect("/blog")
+		abs_index = os.path.join(BLOG_ROOT, "page", name, "index.html")
+		return _serve(abs_index) if _isfile(abs_index) else _NOT_FOUND
+
+	# Resolve /blog/<category> to the first language that has it (preferring us, then mexico, then latam)
+	lang = CATEGORY_TO_LANG.get(name)
+	if lang is not None:
+		return _redirect(f"/blog/{lang}/{name}")
+
+	# 2b) Old flat blog URL: /blog/<slug> -> redirect to nested if known
+	meta = SLUG_META.get(name)
+	return _redirect(meta.canonical_url) if meta else _NOT_FOUND
+
+
+def _route_blog_pair(segments: List[str]) -> Optional[RouteDecision]:
+	first, second = segments[1], segments[2]
+
+	# 1a.1) Category listing: /blog/<lang>/<category>
+	if first in _LANG_SET and second:
+		candidate = os.path.join(BLOG_ROOT, first, second, "index.html")
+		if _isfile(candidate):
+			return _serve(candidate)
+		# If not category, let deeper rules handle as post
+
+	# 1c) Redirect /blog/page/<n> -> /blog or /blog/<n>
+	if first == "page" and _is_page_number(second):
+		return _redirect("/blog" if second == "1" else f"/blog/{second}")
+	return None
+
+
+def _route_blog_triple(segments: List[str]) -> Optional[RouteDecision]:
+	first, second, third = segments[1], segments[2], segments[3]
+
+	# 1a.y) /blog/<lang|category>/<slug>[/index.html] (e.g. WordPress related posts) -> canonical
+	if first and second and third in ("", "index.html"):
+		meta = SLUG_META.get(second)
+		if meta:
+			return _redirect(meta.canonical_url)
+
+	# 1c) Redirect /blog/page/<n>[/index.html] -> /blog or /blog/<n>
+	if first == "page" and _is_page_number(second) and third in ("", "index.html"):
+		return _redirect("/blog" if second == "1" else f"/blog/{second}")
+
+	# 2) Preferred nested blog URL: /blog/<lang>/<category>/<slug>
+	if first and second and third:
+		meta = SLUG_META.get(third)
+		if meta and meta.language == first and meta.category == second:
+			return _serve(meta.abs_index_path)
+		return _redirect(meta.canonical_url) if meta else _NOT_FOUND
+	return None
+
+
+# Paths matched verbatim, checked before any other rule
+_EXACT_ROUTES: Dict[str, Callable[[], Optional[RouteDecision]]] = {
+	# Redirect mirrored host root to /blog (e.g., /blog2.roomiapp.com[/index.html])
+	"/blog2.roomiapp.com": partial(_redirect, "/blog"),
+	"/blog2.roomiapp.com/": partial(_redirect, "/blog"),
+	"/blog2.roomiapp.com/index.html": partial(_redirect, "/blog"),
+	"/blog": _route_blog_home,
+	# Enforce no trailing slash for main blog page
+	"/blog/": partial(_redirect, "/blog"),
+	# Redirect /blog/index.html (used by Categories button) to /blog/us
+	"/blog/index.html": partial(_redirect, "/blog/us"),
+	"/favicon.ico": _route_favicon,
+}
+for _page in STATIC_PAGES:
+	_EXACT_ROUTES[f"/{_page}"] = partial(_route_static_page, _page)
+	_EXACT_ROUTES[f"/{_page}/"] = partial(_redirect, f"/{_page}")
+	_EXACT_ROUTES[f"/{_page}/index.html"] = partial(_redirect, f"/{_page}")
+
+# (segment count, first segment) -> route; a first segment of None stands for any page number
+_DISPATCH: Dict[Tuple[int, Optional[str]], Callable[[List[str]], Optional[RouteDecision]]] = {
+	(1, None): _route_root_page,
+	(2, None): _route_root_page,
+	(2, "blog"): _route_blog_name,
+	(3, "blog"): _route_blog_pair,
+	(4, "blog"): _route_blog_triple,
+}
+_DISPATCH.update({(count, lang): _route_legacy_lang for lang in LANG_CODES for count in range(1, 5)})
+
+
+def _resolve_route(clean_path: str) -> RouteDecision:
+	# Exact paths (blog home, static pages, favicon, mirrored host root) resolve with one dict lookup
+	route = _EXACT_ROUTES.get(clean_path)
+	if route is not None:
+		decision = route()
+		if decision is not None:
+			return decision
+
+	if not clean_path.startswith("/"):
+		return _FALLBACK
+
+	# Split once; the dispatch table and the deep-path rule below both work on these segments
+	segments = clean_path[1:].split("/")
+
+	# Structured routes: dispatch on (segment count, first segment) instead of trying each pattern in turn
+	head = segments[0]
+	route = _DISPATCH.get((len(segments), None if _is_page_number(head) else head))
+	if route is not None:
+		decision = route(segments)
+		if decision is not None:
+			return decision
+
+	# 3-7) Deep paths ending in /<slug>/ or /<slug>/index.html, under /blog, a legacy section
+	# (/us, /tag, /author, ...) or anywhere else -> redirect to nested when the slug exists
+	if len(segments) >= 3 and segments[-1] in ("", "index.html"):
+		meta = SLUG_META.get(segments[-2])
+		if meta:
+			return _redirect(meta.canonical_url)
+
+	# 9) Anything else: fall back to default static file handling
+	return _FALLBACK
+
+
+# Decisions depend only on the path, SLUG_META/CATEGORY_TO_LANG and which index.html files exist,
+# so the same paths are routed once and then looked up; reload_slug_meta clears this cache, which
+# also picks up added or removed listing and static pages. Only serve and redirect decisions for
+# paths up to ROUTE_CACHE_MAX_PATH are kept: those come from known slugs, index files and fixed
+# routes, while 404s and fallbacks cover every junk URL a scanner sends.
+ROUTE_CACHE_MAX_ENTRIES = 4096
+ROUTE_CACHE_MAX_PATH = 256
+_CACHED_ROUTE_KINDS = frozenset((ROUTE_SERVE, ROUTE_REDIRECT))
+_route_cache: "OrderedDict[str, RouteDecision]" = OrderedDict()
+_route_cache_lock = threading.Lock()
+# Bumped by _clear_route_cache; a decision resolved across a reload is returned but not stored
+_route_cache_generation = 0
+
+
+def _route(clean_path: str) -> RouteDecision:
+	with _route_cache_lock:
+		decision = _route_cache.get(clean_path)
+		if decision is not None:
+			_route_cache.move_to_end(clean_path)
+			return decision
+		generation = _route_cache_generation
+	decision = _resolve_route(clean_path)
+	if decision.kind in _CACHED_ROUTE_KINDS and len(clean_path) <= ROUTE_CACHE_MAX_PATH:
+		with _route_cache_lock:
+			if generation != _route_cache_generation:
+				return decision
+			_route_cache[clean_path] = decision
+			_route_cache.move_to_end(clean_path)
+			if len(_route_cache) > ROUTE_CACHE_MAX_ENTRIES:
+				_route_cache.popitem(last=False)
+	return decision
+
+
+def _clear_route_cache() -> None:
+	global _route_cache_generation
+	with _route_cache_lock:
+		_route_cache.clear()
+		_route_cache_generation += 1
+
+
+class BlogHTTPServer(http.server.ThreadingHTTPServer):
+	# socketserver's default listen backlog of 5 refuses connections under modest bursts
+	request_queue_size = 128
+
+
 def run(port: int) -> None:
 	os.chdir(WORKSPACE_DIR)
 	server_address = ("127.0.0.1", port)
-	httpd = http.server.ThreadingHTTPServer(server_address, BlogRequestHandler)
+	httpd = BlogHTTPServer(server_address, BlogRequestHandler)
+	if hasattr(signal, "SIGHUP"):
+		signal.signal(signal.SIGHUP, lambda _signum, _frame: reload_slug_meta())
 	print(f"[info] Serving at http://{server_address[0]}:{server_address[1]}")
 	try:
 		httpd.serve_forever()